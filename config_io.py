@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+config.ini读写工具
+quick_calibrate 与 smooth_settings 共用：同一个解析器、同一份缓存、同样的原子写回
+"""
+
+import os
+import re
+
+# 节标题与键值行（与 configparser 一样按首个 = 或 : 分割），模块加载时编译一次
+_SECTION_RE = re.compile(r'^\[(?P<section>[^\]]+)\]')
+_OPTION_RE = re.compile(r'^(?P<key>[^=:;#\s][^=:]*)[=:](?P<val>.*)$')
+
+
+class FastConfigParser:
+    """轻量INI读写器 - 只解析键值行，写回时原样保留其余行（含注释）"""
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._lines = f.read().splitlines()
+        except FileNotFoundError:
+            self._lines = []  # 文件不存在时从空配置开始，写回时创建
+        self._index()
+
+    def _index(self):
+        """建立 节 -> {键: (行号, 值)} 索引，键名与 configparser 一样不区分大小写"""
+        self._sections = {}
+        self._tails = {}  # 每个节最后一个键值行（或节标题）的行号，新键插在其后
+        section = None
+        options = None
+        for i, line in enumerate(self._lines):
+            stripped = line.strip()
+            match = _SECTION_RE.match(stripped)
+            if match:
+                section = match.group('section')
+                self._tails[section] = i
+                options = self._sections.setdefault(section, {})
+                continue
+            if options is None:
+                continue
+            match = _OPTION_RE.match(stripped)
+            if match:
+                options[match.group('key').strip().lower()] = (i, match.group('val').strip())
+                self._tails[section] = i
+
+    def get(self, section, key, fallback=None):
+        """读取键值，不存在时返回fallback"""
+        entry = self._sections.get(section, {}).get(key.lower())
+        return entry[1] if entry else fallback
+
+    def defaults(self):
+        """返回 DEFAULT 节的 {小写键: 值}"""
+        return {key: entry[1] for key, entry in self._sections.get('DEFAULT', {}).items()}
+
+    def set(self, section, key, value):
+        """设置键值：已有的键原地替换，否则追加到该节末尾（节不存在则新建）"""
+        line = f"{key} = {value}"
+        entry = self._sections.get(section, {}).get(key.lower())
+        if entry:
+            self._lines[entry[0]] = line
+        elif section in self._tails:
+            self._lines.insert(self._tails[section] + 1, line)
+        elif section == 'DEFAULT':
+            # 与 configparser 一致，DEFAULT 节放在文件最前
+            self._lines[0:0] = ['[DEFAULT]', line, '']
+        else:
+            self._lines.extend(['', f"[{section}]", line])
+        self._index()
+
+    def write(self, path=None):
+        """写回文件"""
+        with open(path or self.path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self._lines) + '\n')
+
+
+# 按 (路径, mtime, 大小) 缓存解析结果，菜单反复操作时不必重新解析
+_CACHE = {"path": None, "mtime_ns": -1, "size": -1, "config": None}
+
+
+def load_config(config_path):
+    """读取配置，文件未修改时返回缓存的解析结果；文件不存在时返回空配置"""
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        return FastConfigParser(config_path)
+    if (_CACHE["path"] != config_path or _CACHE["mtime_ns"] != st.st_mtime_ns
+            or _CACHE["size"] != st.st_size):
+        _CACHE.update(path=config_path, mtime_ns=st.st_mtime_ns, size=st.st_size,
+                      config=FastConfigParser(config_path))
+    return _CACHE["config"]
+
+
+def invalidate_config():
+    """缓存的配置可能已被改动但未写入时，强制下次重新解析"""
+    _CACHE["mtime_ns"] = -1
+
+
+def save_config(config):
+    """写回配置并同步缓存的 mtime/大小（内存中的内容即文件内容，无需重新解析）"""
+    # 先写临时文件再原子替换，写入中途出错不会留下被截断的 config.ini
+    tmp_path = config.path + '.tmp'
+    try:
+        config.write(tmp_path)
+        os.replace(tmp_path, config.path)
+    except Exception:
+        invalidate_config()
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    st = os.stat(config.path)
+    _CACHE.update(path=config.path, mtime_ns=st.st_mtime_ns, size=st.st_size, config=config)
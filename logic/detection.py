@@ -0,0 +1,47 @@
+import torch
+import supervision as sv
+
+from logic.config_watcher import cfg
+
+# 输入尺寸固定，让 cuDNN 首帧选出最快的卷积算法并缓存
+torch.backends.cudnn.benchmark = True
+
+# 简化的tracker配置
+tracker = sv.ByteTrack() if not cfg.disable_tracker else None
+
+# 每帧不变的预测参数，只构建一次；conf/device 等可热重载的配置仍在调用时读取
+_PREDICT_KWARGS = dict(
+    iou=0.50,
+    max_det=20,
+    agnostic_nms=False,
+    augment=False,
+    vid_stride=False,
+    visualize=False,
+    verbose=False,
+    show_boxes=False,
+    show_labels=False,
+    show_conf=False,
+    save=False,
+    show=False,
+    stream=True
+)
+
+@torch.inference_mode()
+def perform_detection(model, image, tracker: sv.ByteTrack | None = None):
+    """执行YOLO检测 - 简化配置"""
+    results = model.predict(
+        source=image,
+        imgsz=cfg.ai_model_image_size,
+        conf=cfg.AI_conf,
+        device=cfg.AI_device,
+        half="cpu" not in cfg.AI_device,
+        cfg="logic/tracker.yaml" if tracker else "logic/game.yaml",
+        **_PREDICT_KWARGS
+    )
+
+    if tracker:
+        for res in results:
+            det = sv.Detections.from_ultralytics(res)
+            return tracker.update_with_detections(det)
+    else:
+        return next(results)
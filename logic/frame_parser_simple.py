@@ -36,7 +36,6 @@ class SimpleTarget:
         """Phase 3.9最终: 最终头部瞄准点 - 远距离20.7%，中距离31.8%，近距离38.8%向上调整"""
         if self.cls == 7:  # 头部目标
             # Phase 3: 智能头部瞄准点计算
-            from logic.capture import capture
             center_x = capture.screen_x_center
             center_y = capture.screen_y_center
             distance_to_center = math.sqrt((self.x - center_x)**2 + (self.y - center_y)**2)
@@ -58,8 +57,8 @@ class SimpleTarget:
             
             # 调试信息（仅远距离显示）
             if distance_to_center > 30:
-                logger.info(f"🎯 Phase 3.9最终: 头部瞄准点最终调整 - 距离{distance_to_center:.0f}px, "
-                           f"尺寸{self.w:.0f}x{self.h:.0f}, 偏移{y_offset_ratio*size_factor:.2f}")
+                logger.info("🎯 Phase 3.9最终: 头部瞄准点最终调整 - 距离%.0fpx, 尺寸%.0fx%.0f, 偏移%.2f",
+                           distance_to_center, self.w, self.h, y_offset_ratio * size_factor)
         else:  # 身体目标
             # Phase 3.9再改: 身体目标再次微调偏移 - 再次降低一点
             aim_x = self.x  
@@ -129,7 +128,7 @@ class TargetTracker:
         
         # 减少日志输出
         if prediction_distance > 5:  # 只有在预测距离较大时才打印
-            logger.info(f"🔮 简化预测: ({target.x:.0f},{target.y:.0f}) -> ({predicted_x:.0f},{predicted_y:.0f})")
+            logger.info("🔮 简化预测: (%.0f,%.0f) -> (%.0f,%.0f)", target.x, target.y, predicted_x, predicted_y)
         
         return predicted_x, predicted_y
 
@@ -186,7 +185,8 @@ class SimpleFrameParser:
         is_head_target = (target.cls == 7)
         target_velocity = math.sqrt(target.velocity_x**2 + target.velocity_y**2) if hasattr(target, 'velocity_x') else 0
         
-        logger.info(f"🎯 Target acquired: {'HEAD' if is_head_target else 'BODY'}, aim_point=({target.aim_x:.1f}, {target.aim_y:.1f})")
+        logger.info("🎯 Target acquired: %s, aim_point=(%.1f, %.1f)",
+                    'HEAD' if is_head_target else 'BODY', target.aim_x, target.aim_y)
         
         # 简化直接移动，传递头部标识
         mouse.move_to_target(target.aim_x, target.aim_y, target_velocity, is_head_target)
@@ -238,7 +238,7 @@ class SimpleFrameParser:
             head_distance = math.sqrt(distances_sq[nearest_idx].item())
             target_type = "HEAD"
             
-            logger.info(f"🎯 Selected HEAD target at distance {head_distance:.1f}px")
+            logger.info("🎯 Selected HEAD target at distance %.1fpx", head_distance)
             
         elif body_mask.any():
             # 没有头部目标，选择最近的身体目标
@@ -248,7 +248,7 @@ class SimpleFrameParser:
             body_distance = math.sqrt(distances_sq[nearest_idx].item())
             target_type = "BODY"
             
-            logger.info(f"🎯 Selected BODY target at distance {body_distance:.1f}px")
+            logger.info("🎯 Selected BODY target at distance %.1fpx", body_distance)
         else:
             # 没有头部和身体目标
             logger.info("🎯 No HEAD or BODY targets found")
@@ -256,8 +256,10 @@ class SimpleFrameParser:
         
         
         # 创建目标对象
-        target_data = boxes_array[nearest_idx, :4].cpu().numpy()
-        target_class = classes_tensor[nearest_idx].item()
+        # 框和类别拼成一行，只做一次设备到主机的同步
+        *target_data, target_class = torch.cat(
+            (boxes_array[nearest_idx, :4], classes_tensor[nearest_idx:nearest_idx + 1])
+        ).tolist()
         
         target = SimpleTarget(*target_data, target_class, time.time())
         
@@ -107,8 +107,9 @@ class UltraSimpleFrameParser:
                 return None
         
         # 创建目标
-        target_data = boxes_array[nearest_idx, :4].cpu().numpy()
-        target_class = classes_tensor[nearest_idx].item()
+        *target_data, target_class = torch.cat(
+            (boxes_array[nearest_idx, :4], classes_tensor[nearest_idx:nearest_idx + 1])
+        ).tolist()
         target = UltraSimpleTarget(*target_data, target_class)
         
         return target
@@ -123,7 +124,7 @@ class UltraSimpleFrameParser:
             return
         
         # 直接移动到目标
-        logger.info(f"🎯 瞄准{'头部' if target.is_head else '身体'}: ({target.aim_x:.1f}, {target.aim_y:.1f})")
+        logger.info("🎯 瞄准%s: (%.1f, %.1f)", '头部' if target.is_head else '身体', target.aim_x, target.aim_y)
         mouse.move_to_target(target.aim_x, target.aim_y, 0, target.is_head)
         
         # 检查是否射击
@@ -223,6 +223,20 @@ class Visuals(threading.Thread):
             except Exception as e:
                 logger.error(f'[Visuals] Error with on top window, skipping this option `debug_window_always_on_top`: {e}')
                 
+    def put_frame(self, image):
+        # 只保留最新一帧：队列满时丢弃旧帧，检测循环不会被显示线程阻塞
+        try:
+            self.queue.put_nowait(image)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(image)
+            except queue.Full:
+                pass
+                
     def draw_target_line(self, target_x, target_y, target_cls):
         if target_cls not in self.disabled_line_classes:
             self.draw_line_data = (target_x, target_y)
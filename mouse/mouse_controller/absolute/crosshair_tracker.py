@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from ..algorithms.coordinate_mapping import CoordinateMapper, GameSettings
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSnapshot:
     """位置快照"""
     x: float
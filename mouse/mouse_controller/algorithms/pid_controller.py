@@ -46,15 +46,12 @@ class RelativeMovementTracker:
         """应用一次移动"""
         self.cumulative_x += dx
         self.cumulative_y += dy
-        self.total_distance += math.sqrt(dx*dx + dy*dy)
+        self.total_distance += math.hypot(dx, dy)
         self.move_count += 1
         
     def get_remaining_distance(self, target_x: int, target_y: int) -> float:
         """计算到目标的剩余距离"""
-        return math.sqrt(
-            (target_x - self.cumulative_x)**2 + 
-            (target_y - self.cumulative_y)**2
-        )
+        return math.hypot(target_x - self.cumulative_x, target_y - self.cumulative_y)
     
     def get_statistics(self) -> dict:
         """获取移动统计信息"""
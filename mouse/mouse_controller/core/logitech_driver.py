@@ -34,6 +34,8 @@ class LogitechDriver(BaseDriver):
             # 设置函数签名
             self.dll.moveR.argtypes = [ctypes.c_int, ctypes.c_int]
             self.dll.moveR.restype = None
+            # 注：CDLL 调用期间 ctypes 会释放 GIL，moveR 不会阻塞截图/推理线程；
+            # 参数只能是 c_int 等原生类型，不要改用 PyDLL 或 py_object 参数
             
             self.is_initialized = True
             self.driver_info = {
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 import unittest
 import time
-import math
-import statistics
+from time import perf_counter_ns
+from math import cos, fsum, hypot, pi, sin, sqrt
 import random
 from collections import namedtuple
 
@@ -12,62 +12,97 @@ import mouse
 # 测试结果数据结构
 TestResult = namedtuple('TestResult', ['precision_error', 'speed_fps', 'duration', 'test_name'])
 
+def _mean(values):
+    """返回均值（替代 statistics.mean，避免其逐项精确有理数运算）"""
+    return fsum(values) / len(values)
+
+def _mean_stdev(values):
+    """返回 (均值, 样本标准差)，样本不足两个时标准差为0"""
+    n = len(values)
+    mean = _mean(values)
+    if n < 2:
+        return mean, 0.0
+    variance = fsum((v - mean) * (v - mean) for v in values) / (n - 1)
+    return mean, sqrt(variance)
+
+class _SimulatedClock(object):
+    """替代 mouse 模块内的 time：sleep 只推进虚拟时间，不真正等待"""
+    
+    def __init__(self):
+        self.now = 0.0
+        
+    def perf_counter(self):
+        return self.now
+        
+    def sleep(self, seconds):
+        self.now += seconds
+
 class FPSMouseTester(object):
     """FPS游戏鼠标移动专用测试器"""
     
     def __init__(self):
-        self.move_events = []
-        self.start_time = None
-        self.end_time = None
+        # 路径长度和速度统计在 record_move 中流式累积，不保存原始事件
+        # 时间戳均为 perf_counter_ns 整数纳秒，只在计算速度时换算成秒
+        self.reset()
         
     def record_move(self, x, y):
-        """记录鼠标移动事件"""
-        current_time = time.perf_counter()
-        self.move_events.append((x, y, current_time))
+        """记录鼠标移动事件，同时更新路径长度和速度的 Welford 统计量"""
+        now = perf_counter_ns()
+        count = self.move_count
+        if count:
+            distance = hypot(x - self._last_x, y - self._last_y)
+            self.total_distance += distance
+            time_diff = now - self._last_time
+            speed = distance * 1e9 / time_diff if time_diff > 0 else 0
+            # 第 count 个速度样本（速度样本数 = 事件数 - 1）
+            delta = speed - self._speed_mean
+            self._speed_mean += delta / count
+            self._speed_m2 += delta * (speed - self._speed_mean)
+        self.move_count = count + 1
+        self._last_x = x
+        self._last_y = y
+        self._last_time = now
+        
+    def reset(self):
+        """清空已记录的统计量和起止时间，便于复用同一个实例"""
+        self.move_count = 0
+        self.total_distance = 0.0
+        self._speed_mean = 0.0
+        self._speed_m2 = 0.0
+        self._last_x = None
+        self._last_y = None
+        self._last_time = None
+        self.start_time = None
+        self.end_time = None
         
     def start_recording(self):
         """开始记录"""
-        self.move_events = []
-        self.start_time = time.perf_counter()
+        self.reset()
+        self.start_time = perf_counter_ns()
         
     def stop_recording(self):
         """停止记录"""
-        self.end_time = time.perf_counter()
+        self.end_time = perf_counter_ns()
         
     def calculate_precision_error(self, target_x, target_y, actual_x, actual_y):
         """计算精度误差（像素距离）"""
-        return math.sqrt((target_x - actual_x)**2 + (target_y - actual_y)**2)
+        return hypot(target_x - actual_x, target_y - actual_y)
         
     def calculate_movement_speed(self):
         """计算移动速度（像素/秒）"""
-        if len(self.move_events) < 2:
+        if self.move_count < 2:
             return 0
-            
-        total_distance = 0
-        for i in range(1, len(self.move_events)):
-            x1, y1, t1 = self.move_events[i-1]
-            x2, y2, t2 = self.move_events[i]
-            distance = math.sqrt((x2-x1)**2 + (y2-y1)**2)
-            total_distance += distance
-            
-        total_time = self.end_time - self.start_time
-        return total_distance / total_time if total_time > 0 else 0
+
+        total_time = (self.end_time - self.start_time) / 1e9
+        return self.total_distance / total_time if total_time > 0 else 0
         
     def calculate_smoothness(self):
         """计算移动平滑度（速度变化的标准差）"""
-        if len(self.move_events) < 3:
+        if self.move_count < 3:
             return 0
             
-        speeds = []
-        for i in range(1, len(self.move_events)):
-            x1, y1, t1 = self.move_events[i-1]
-            x2, y2, t2 = self.move_events[i]
-            distance = math.sqrt((x2-x1)**2 + (y2-y1)**2)
-            time_diff = t2 - t1
-            speed = distance / time_diff if time_diff > 0 else 0
-            speeds.append(speed)
-            
-        return statistics.stdev(speeds) if len(speeds) > 1 else 0
+        # 速度样本数为 move_count - 1，样本方差再除以 (样本数 - 1)
+        return sqrt(self._speed_m2 / (self.move_count - 2))
 
 
 class TestFPSMouse(unittest.TestCase):
@@ -82,12 +117,15 @@ class TestFPSMouse(unittest.TestCase):
         self.current_position = (0, 0)
         self.original_move_to = mouse._os_mouse.move_to if hasattr(mouse._os_mouse, 'move_to') else None
         
-        # 重写move_to方法来记录移动
+        # 重写move_to方法来记录移动；回调中用到的方法预先绑定为闭包变量，省去逐次属性查找
+        record_move = self.tester.record_move
+        original_move_to = self.original_move_to
+
         def mock_move_to(x, y):
             self.current_position = (x, y)
-            self.tester.record_move(x, y)
-            if self.original_move_to:
-                self.original_move_to(x, y)
+            record_move(x, y)
+            if original_move_to:
+                original_move_to(x, y)
                 
         mouse._os_mouse.move_to = mock_move_to
         
@@ -224,23 +262,30 @@ class TestFPSMouse(unittest.TestCase):
         center = (960, 540)
         test_count = 50  # 随机测试次数
         
-        random.seed(42)  # 固定种子确保可重复测试
+        # 独立的随机数生成器，固定种子确保可重复测试，且不改动全局random状态
+        rng = random.Random(42)
+        uniform = rng.uniform
         
-        for i in range(test_count):
-            # 随机角度和距离
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(100, 800)
-            
-            # 计算目标位置
-            target_x = center[0] + distance * math.cos(angle)
-            target_y = center[1] + distance * math.sin(angle)
-            target_pos = (int(target_x), int(target_y))
-            
-            # 随机移动时间
-            duration = random.uniform(0.05, 0.3)
-            
-            with self.subTest(iteration=i):
-                self._test_random_movement(center, target_pos, duration, f"random_{i}")
+        # 预先生成全部随机场景：(角度, 距离, 移动时间)，抽样顺序与逐次生成一致
+        scenarios = [
+            (uniform(0, 2 * pi), uniform(100, 800), uniform(0.05, 0.3))
+            for _ in range(test_count)
+        ]
+        
+        # 本测试只检查落点精度，用模拟时钟回放移动，各次移动不再累积真实等待时间
+        real_time = mouse._time
+        mouse._time = _SimulatedClock()
+        try:
+            for i, (angle, distance, duration) in enumerate(scenarios):
+                # 计算目标位置
+                target_x = center[0] + distance * cos(angle)
+                target_y = center[1] + distance * sin(angle)
+                target_pos = (int(target_x), int(target_y))
+                
+                with self.subTest(iteration=i):
+                    self._test_random_movement(center, target_pos, duration, f"random_{i}")
+        finally:
+            mouse._time = real_time
                 
     def test_multi_directional_sequence(self):
         """多方向连续移动测试 - 模拟复杂战斗场景"""
@@ -302,7 +347,7 @@ class TestFPSMouse(unittest.TestCase):
         )
         
         # 计算移动距离
-        distance = math.sqrt((target_pos[0] - start_pos[0])**2 + (target_pos[1] - start_pos[1])**2)
+        distance = hypot(target_pos[0] - start_pos[0], target_pos[1] - start_pos[1])
         
         # 记录测试结果
         result = TestResult(
@@ -366,10 +411,7 @@ class TestFPSMouse(unittest.TestCase):
         self.tester.stop_recording()
         
         # 计算理论速度
-        expected_distance = math.sqrt(
-            (target_pos[0] - start_pos[0])**2 + 
-            (target_pos[1] - start_pos[1])**2
-        )
+        expected_distance = hypot(target_pos[0] - start_pos[0], target_pos[1] - start_pos[1])
         expected_speed = expected_distance / duration
         
         # 计算实际速度
@@ -428,12 +470,13 @@ class TestFPSMouse(unittest.TestCase):
         
     def _test_circular_tracking(self, center, radius, steps, duration):
         """测试圆形轨迹追踪"""
-        points = []
-        for i in range(steps):
-            angle = 2 * math.pi * i / steps
-            x = center[0] + radius * math.cos(angle)
-            y = center[1] + radius * math.sin(angle)
-            points.append((x, y))
+        # 一次性生成整条圆形轨迹
+        angle_step = 2 * pi / steps
+        cx, cy = center
+        points = [
+            (cx + radius * cos(angle_step * i), cy + radius * sin(angle_step * i))
+            for i in range(steps)
+        ]
             
         # 开始记录
         self.tester.start_recording()
@@ -496,20 +539,23 @@ class TestFPSMouse(unittest.TestCase):
     def test_performance_benchmark(self):
         """性能基准测试 - 大量重复测试"""
         test_iterations = 100
-        errors = []
-        speeds = []
+        # 只收集有效样本，在循环内直接过滤异常值，省去事后的列表推导
+        valid_errors = []
+        valid_speeds = []
         
         start_pos = (400, 300)
         target_pos = (800, 600)
         
         # 计算理论距离和速度
-        expected_distance = math.sqrt((target_pos[0] - start_pos[0])**2 + (target_pos[1] - start_pos[1])**2)
+        expected_distance = hypot(target_pos[0] - start_pos[0], target_pos[1] - start_pos[1])
         test_duration = 0.2
         expected_speed = expected_distance / test_duration
         
+        # 复用同一个tester（mock回调也记录到它），每轮开始前reset避免状态污染
+        iteration_tester = self.tester
+        
         for i in range(test_iterations):
-            # 为每次测试创建新的tester实例，避免状态污染
-            iteration_tester = FPSMouseTester()
+            iteration_tester.reset()
             
             # 移动到起始位置
             mouse.move(start_pos[0], start_pos[1], absolute=True, duration=0)
@@ -535,26 +581,25 @@ class TestFPSMouse(unittest.TestCase):
             )
             
             # 简化速度计算：直接使用实际移动距离和时间
-            actual_distance = math.sqrt((final_pos[0] - start_actual_pos[0])**2 + 
-                                      (final_pos[1] - start_actual_pos[1])**2)
-            speed = actual_distance / test_duration if test_duration > 0 else 0
+            actual_distance = hypot(final_pos[0] - start_actual_pos[0],
+                                    final_pos[1] - start_actual_pos[1])
+            speed = actual_distance / test_duration
             
-            errors.append(error)
-            speeds.append(speed)
+            # 过滤掉异常值（可能的计算错误）
+            if error < 100:  # 过滤掉过大的误差
+                valid_errors.append(error)
+            if speed > 0:    # 过滤掉为0的速度
+                valid_speeds.append(speed)
             
-        # 过滤掉异常值（可能的计算错误）
-        valid_errors = [e for e in errors if e < 100]  # 过滤掉过大的误差
-        valid_speeds = [s for s in speeds if s > 0]    # 过滤掉为0的速度
-        
         if not valid_errors:
             valid_errors = [0]  # 如果没有有效误差，设置为0
         if not valid_speeds:
             valid_speeds = [expected_speed]  # 如果没有有效速度，使用理论速度
             
         # 计算统计数据
-        avg_error = statistics.mean(valid_errors)
+        avg_error, error_stdev = _mean_stdev(valid_errors)
         max_error = max(valid_errors)
-        avg_speed = statistics.mean(valid_speeds)
+        avg_speed, speed_stdev = _mean_stdev(valid_speeds)
         min_speed = min(valid_speeds)
         
         # 记录基准测试结果
@@ -577,9 +622,9 @@ class TestFPSMouse(unittest.TestCase):
         print(f"最低移动速度: {min_speed:.2f}px/s")
         print(f"理论速度: {expected_speed:.2f}px/s")
         if len(valid_errors) > 1:
-            print(f"精度稳定性: {statistics.stdev(valid_errors):.3f}px")
+            print(f"精度稳定性: {error_stdev:.3f}px")
         if len(valid_speeds) > 1:
-            print(f"速度稳定性: {statistics.stdev(valid_speeds):.2f}px/s")
+            print(f"速度稳定性: {speed_stdev:.2f}px/s")
         
         # 调整断言标准，更加实际
         self.assertLessEqual(avg_error, 5.0, f"平均精度误差过大: {avg_error:.3f}px")
@@ -599,11 +644,11 @@ class TestFPSMouse(unittest.TestCase):
         speed_tests = [r for r in self.test_results if 'speed' in r.test_name]
         
         if precision_tests:
-            avg_precision = statistics.mean([r.precision_error for r in precision_tests])
+            avg_precision = _mean([r.precision_error for r in precision_tests])
             print(f"平均精度误差: {avg_precision:.3f}px")
             
         if speed_tests:
-            avg_speed = statistics.mean([r.speed_fps for r in speed_tests])
+            avg_speed = _mean([r.speed_fps for r in speed_tests])
             print(f"平均移动速度: {avg_speed:.2f}px/s")
 
 
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+mouse_new加载工具
+测试脚本共用，按文件路径加载mouse_new包
+"""
+
+import sys
+import os
+import importlib.util
+
+# 路径只依赖__file__，模块加载时计算一次
+project_path = os.path.dirname(os.path.abspath(__file__))
+mouse_new_path = os.path.join(project_path, 'mouse_new')
+mouse_init_path = os.path.join(mouse_new_path, 'mouse', '__init__.py')
+
+def load_mouse_new():
+    """按文件路径加载mouse_new包，不修改sys.path，也不会与项目根目录的mouse包重名"""
+    module = sys.modules.get('mouse_new')
+    if module is not None:
+        return module
+    
+    spec = importlib.util.spec_from_file_location('mouse_new', mouse_init_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['mouse_new'] = module  # 包内的相对导入需要先注册模块
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules['mouse_new']
+        raise
+    return module
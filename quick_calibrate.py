@@ -4,9 +4,10 @@
 通过配置文件快速调整鼠标偏移
 """
 
-import configparser
 import os
 
+from config_io import load_config, save_config
+
 def quick_calibrate():
     """快速校准鼠标偏移"""
     print("="*60)
@@ -42,20 +43,14 @@ def quick_calibrate():
         return
     
     try:
-        config = configparser.ConfigParser()
-        config.read(config_path, encoding='utf-8')
-        
-        # 确保有默认section
-        if 'DEFAULT' not in config:
-            config.add_section('DEFAULT')
+        config = load_config(config_path)
         
-        # 添加偏移配置
-        config['DEFAULT']['mouse_offset_x'] = str(int(offset_x))
-        config['DEFAULT']['mouse_offset_y'] = str(int(offset_y))
+        # 添加偏移配置（DEFAULT节不存在时自动创建）
+        config.set('DEFAULT', 'mouse_offset_x', int(offset_x))
+        config.set('DEFAULT', 'mouse_offset_y', int(offset_y))
         
         # 写入配置文件
-        with open(config_path, 'w', encoding='utf-8') as f:
-            config.write(f)
+        save_config(config)
         
         print("✅ 配置已更新到 config.ini")
         print()
@@ -77,8 +72,7 @@ def show_current_settings():
         return
     
     try:
-        config = configparser.ConfigParser()
-        config.read(config_path, encoding='utf-8')
+        config = load_config(config_path)
         
         offset_x = config.get('DEFAULT', 'mouse_offset_x', fallback='0')
         offset_y = config.get('DEFAULT', 'mouse_offset_y', fallback='0')
@@ -98,17 +92,12 @@ def reset_offset():
         return
     
     try:
-        config = configparser.ConfigParser()
-        config.read(config_path, encoding='utf-8')
-        
-        if 'DEFAULT' not in config:
-            config.add_section('DEFAULT')
+        config = load_config(config_path)
         
-        config['DEFAULT']['mouse_offset_x'] = '0'
-        config['DEFAULT']['mouse_offset_y'] = '0'
+        config.set('DEFAULT', 'mouse_offset_x', 0)
+        config.set('DEFAULT', 'mouse_offset_y', 0)
         
-        with open(config_path, 'w', encoding='utf-8') as f:
-            config.write(f)
+        save_config(config)
         
         print("✅ 偏移已重置为0")
         
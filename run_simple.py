@@ -1,5 +1,5 @@
 from ultralytics import YOLO
-import torch
+import time
 
 from logic.config_watcher import cfg
 from logic.capture import capture
@@ -7,44 +7,8 @@ from logic.visual import visuals
 from logic.frame_parser_simple import simpleFrameParser
 from logic.hotkeys_watcher import hotkeys_watcher
 from logic.checks import run_checks
-import supervision as sv
-
-# 简化的tracker配置
-tracker = sv.ByteTrack() if not cfg.disable_tracker else None
-
-@torch.inference_mode()
-def perform_detection(model, image, tracker: sv.ByteTrack | None = None):
-    """执行YOLO检测 - 简化配置"""
-    kwargs = dict(
-        source=image,
-        imgsz=cfg.ai_model_image_size,
-        conf=cfg.AI_conf,
-        iou=0.50,
-        device=cfg.AI_device,
-        half=not "cpu" in cfg.AI_device,
-        max_det=20,
-        agnostic_nms=False,
-        augment=False,
-        vid_stride=False,
-        visualize=False,
-        verbose=False,
-        show_boxes=False,
-        show_labels=False,
-        show_conf=False,
-        save=False,
-        show=False,
-        stream=True
-    )
-
-    kwargs["cfg"] = "logic/tracker.yaml" if tracker else "logic/game.yaml"
-    results = model.predict(**kwargs)
-
-    if tracker:
-        for res in results:
-            det = sv.Detections.from_ultralytics(res)
-            return tracker.update_with_detections(det)
-    else:
-        return next(results)
+from logic.detection import tracker, perform_detection
+from logic.logger import logger
 
 def init():
     """简化的初始化和主循环"""
@@ -62,6 +26,7 @@ def init():
         quit(0)
     
     frame_count = 0
+    last_log_time = time.monotonic()
     
     print("🎯 Simple aimbot started - YOLO → Aim → Shoot")
     
@@ -80,7 +45,7 @@ def init():
                 
                 # 更新可视化
                 if cfg.show_window or cfg.show_overlay:
-                    visuals.queue.put(image)
+                    visuals.put_frame(image)
                 
                 # 执行检测
                 result = perform_detection(model, image, tracker)
@@ -89,9 +54,11 @@ def init():
                 if hotkeys_watcher.app_pause == 0:
                     simpleFrameParser.parse(result)
                 
-                # 每1000帧打印一次状态
-                if frame_count % 1000 == 0:
-                    print(f"📊 Processed {frame_count} frames")
+                # 每5秒打印一次状态，与帧率无关
+                now = time.monotonic()
+                if now - last_log_time >= 5.0:
+                    logger.info("📊 Processed %d frames", frame_count)
+                    last_log_time = now
                     
         except KeyboardInterrupt:
             print("\n⚡ Stopping simple aimbot...")
@@ -4,9 +4,86 @@
 调整mouse_new的移动参数以获得最佳体验
 """
 
-import configparser
 import os
 
+from config_io import load_config, save_config, invalidate_config
+
+# 预设参数表（只读），模块加载时构建一次
+PRESETS = {
+    '1': {  # 极速模式
+        'mouse_move_duration': '0.04',
+        'mouse_head_duration': '0.03',
+        'mouse_steps_per_second': '300.0',
+        'mouse_move_threshold': '5',
+        'mouse_debounce_time': '0.02',
+        'min_move_distance': '2'
+    },
+    '2': {  # 平衡模式（推荐）
+        'mouse_move_duration': '0.08',
+        'mouse_head_duration': '0.06',
+        'mouse_steps_per_second': '240.0',
+        'mouse_move_threshold': '8',
+        'mouse_debounce_time': '0.05',
+        'min_move_distance': '3'
+    },
+    '3': {  # 丝滑模式
+        'mouse_move_duration': '0.12',
+        'mouse_head_duration': '0.09',
+        'mouse_steps_per_second': '180.0',
+        'mouse_move_threshold': '12',
+        'mouse_debounce_time': '0.08',
+        'min_move_distance': '4'
+    },
+    '4': {  # 精准模式
+        'mouse_move_duration': '0.10',
+        'mouse_head_duration': '0.08',
+        'mouse_steps_per_second': '200.0',
+        'mouse_move_threshold': '6',
+        'mouse_debounce_time': '0.06',
+        'min_move_distance': '2'
+    }
+}
+
+MODE_NAMES = {
+    '1': '极速模式',
+    '2': '平衡模式',
+    '3': '丝滑模式',
+    '4': '精准模式'
+}
+
+
+def _to_int(text):
+    """像素类参数允许输入小数，截断为整数"""
+    return int(float(text))
+
+
+# 自定义参数表：(提示名, 配置键, 转换函数, 推荐范围)
+SMOOTH_FIELDS = (
+    ('身体目标移动时长', 'mouse_move_duration', float, '秒，推荐0.06-0.12'),
+    ('头部目标移动时长', 'mouse_head_duration', float, '秒，推荐0.04-0.08'),
+    ('移动帧率', 'mouse_steps_per_second', float, 'FPS，推荐120-300'),
+    ('移动阈值', 'mouse_move_threshold', _to_int, '像素，推荐5-15'),
+    ('防抖时间', 'mouse_debounce_time', float, '秒，推荐0.02-0.08'),
+    ('最小移动距离', 'min_move_distance', _to_int, '像素，推荐2-5'),
+)
+
+
+def _validate_presets():
+    """导入时校验一次预设表，写错的预设值在启动时就会报错"""
+    casts = {key: cast for _label, key, cast, _hint in SMOOTH_FIELDS}
+    for name, preset in PRESETS.items():
+        for key, text in preset.items():
+            if key not in casts:
+                raise ValueError(f"预设 {name} 含未知参数 {key}")
+            try:
+                casts[key](text)
+            except ValueError:
+                raise ValueError(f"预设 {name} 的 {key} 不是数字: {text}") from None
+
+
+_validate_presets()
+
+
 def show_current_settings():
     """显示当前丝滑移动设置"""
     config_path = "config.ini"
@@ -15,16 +92,15 @@ def show_current_settings():
         return
     
     try:
-        config = configparser.ConfigParser()
-        config.read(config_path, encoding='utf-8')
+        defaults = load_config(config_path).defaults()
         
         # 读取丝滑移动相关设置
-        move_duration = config.get('DEFAULT', 'mouse_move_duration', fallback='0.08')
-        head_duration = config.get('DEFAULT', 'mouse_head_duration', fallback='0.06')
-        steps_per_second = config.get('DEFAULT', 'mouse_steps_per_second', fallback='240.0')
-        move_threshold = config.get('DEFAULT', 'mouse_move_threshold', fallback='8')
-        debounce_time = config.get('DEFAULT', 'mouse_debounce_time', fallback='0.05')
-        min_move_distance = config.get('DEFAULT', 'min_move_distance', fallback='3')
+        move_duration = defaults.get('mouse_move_duration', '0.08')
+        head_duration = defaults.get('mouse_head_duration', '0.06')
+        steps_per_second = defaults.get('mouse_steps_per_second', '240.0')
+        move_threshold = defaults.get('mouse_move_threshold', '8')
+        debounce_time = defaults.get('mouse_debounce_time', '0.05')
+        min_move_distance = defaults.get('min_move_distance', '3')
         
         print("📋 当前丝滑移动设置:")
         print(f"   身体目标移动时长: {move_duration}s ({float(move_duration)*1000:.0f}ms)")
@@ -61,47 +137,41 @@ def update_smooth_settings():
         print("请输入新的参数值（直接按Enter保持当前值）:")
         print()
         
-        body_duration = input("身体目标移动时长 (秒，推荐0.06-0.12): ").strip()
-        head_duration = input("头部目标移动时长 (秒，推荐0.04-0.08): ").strip()
-        steps_fps = input("移动帧率 (FPS，推荐120-300): ").strip()
-        move_threshold = input("移动阈值 (像素，推荐5-15): ").strip()
-        debounce_time = input("防抖时间 (秒，推荐0.02-0.08): ").strip()
-        min_distance = input("最小移动距离 (像素，推荐2-5): ").strip()
+        raw_values = [(label, key, cast, input(f"{label} ({hint}): ").strip())
+                      for label, key, cast, hint in SMOOTH_FIELDS]
+        
+        # 先统一校验转换，出错时指出具体字段，且不会改动配置
+        updates = {}
+        for label, key, cast, raw in raw_values:
+            if raw:
+                try:
+                    updates[key] = str(cast(raw))
+                except ValueError:
+                    print(f"❌ {label} 输入格式错误，请输入数字")
+                    return
         
-        # 读取配置文件
+        # 读取配置文件并一次性更新
         config_path = "config.ini"
-        config = configparser.ConfigParser()
-        if os.path.exists(config_path):
-            config.read(config_path, encoding='utf-8')
+        config = load_config(config_path)
+        changed = {key: value for key, value in updates.items() if config.get('DEFAULT', key) != value}
         
-        if 'DEFAULT' not in config:
-            config.add_section('DEFAULT')
+        # 没有任何改动时不重写文件，mtime 不变，缓存仍然有效
+        if not changed:
+            print()
+            print("ℹ️ 参数未修改")
+            return
         
-        # 更新配置
-        if body_duration:
-            config['DEFAULT']['mouse_move_duration'] = str(float(body_duration))
-        if head_duration:
-            config['DEFAULT']['mouse_head_duration'] = str(float(head_duration))
-        if steps_fps:
-            config['DEFAULT']['mouse_steps_per_second'] = str(float(steps_fps))
-        if move_threshold:
-            config['DEFAULT']['mouse_move_threshold'] = str(int(float(move_threshold)))
-        if debounce_time:
-            config['DEFAULT']['mouse_debounce_time'] = str(float(debounce_time))
-        if min_distance:
-            config['DEFAULT']['min_move_distance'] = str(int(float(min_distance)))
+        for key, value in changed.items():
+            config.set('DEFAULT', key, value)
         
-        # 写入配置文件
-        with open(config_path, 'w', encoding='utf-8') as f:
-            config.write(f)
+        save_config(config)
         
         print()
         print("✅ 配置已更新")
         print("🔄 请重启aimbot以应用新设置")
         
-    except ValueError:
-        print("❌ 输入格式错误，请输入数字")
     except Exception as e:
+        invalidate_config()
         print(f"❌ 更新失败: {e}")
 
 def preset_configs():
@@ -120,75 +190,29 @@ def preset_configs():
     try:
         choice = input("请选择 (1-5): ").strip()
         
-        presets = {
-            '1': {  # 极速模式
-                'mouse_move_duration': '0.04',
-                'mouse_head_duration': '0.03',
-                'mouse_steps_per_second': '300.0',
-                'mouse_move_threshold': '5',
-                'mouse_debounce_time': '0.02',
-                'min_move_distance': '2'
-            },
-            '2': {  # 平衡模式（推荐）
-                'mouse_move_duration': '0.08',
-                'mouse_head_duration': '0.06',
-                'mouse_steps_per_second': '240.0',
-                'mouse_move_threshold': '8',
-                'mouse_debounce_time': '0.05',
-                'min_move_distance': '3'
-            },
-            '3': {  # 丝滑模式
-                'mouse_move_duration': '0.12',
-                'mouse_head_duration': '0.09',
-                'mouse_steps_per_second': '180.0',
-                'mouse_move_threshold': '12',
-                'mouse_debounce_time': '0.08',
-                'min_move_distance': '4'
-            },
-            '4': {  # 精准模式
-                'mouse_move_duration': '0.10',
-                'mouse_head_duration': '0.08',
-                'mouse_steps_per_second': '200.0',
-                'mouse_move_threshold': '6',
-                'mouse_debounce_time': '0.06',
-                'min_move_distance': '2'
-            }
-        }
-        
         if choice == '5':
             update_smooth_settings()
             return
-        elif choice in presets:
-            preset = presets[choice]
+        elif choice in PRESETS:
+            preset = PRESETS[choice]
             
             # 应用预设
             config_path = "config.ini"
-            config = configparser.ConfigParser()
-            if os.path.exists(config_path):
-                config.read(config_path, encoding='utf-8')
-            
-            if 'DEFAULT' not in config:
-                config.add_section('DEFAULT')
+            config = load_config(config_path)
             
+            # 合并预设到 DEFAULT 节，其它节与注释原样保留
             for key, value in preset.items():
-                config['DEFAULT'][key] = value
-            
-            with open(config_path, 'w', encoding='utf-8') as f:
-                config.write(f)
+                config.set('DEFAULT', key, value)
             
-            mode_names = {
-                '1': '极速模式',
-                '2': '平衡模式',
-                '3': '丝滑模式',
-                '4': '精准模式'
-            }
+            save_config(config)
             
-            print(f"✅ 已应用 {mode_names[choice]}")
+            print(f"✅ 已应用 {MODE_NAMES[choice]}")
             print("🔄 请重启aimbot以应用新设置")
         else:
             print("❌ 无效选择")
             
     except Exception as e:
+        invalidate_config()
         print(f"❌ 应用预设失败: {e}")
 
 def main():
@@ -4,13 +4,8 @@
 验证所有功能都正常工作
 """
 
-import sys
-import os
 import math
-
-# 添加mouse_new路径
-mouse_new_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mouse_new')
-sys.path.insert(0, mouse_new_path)
+from mouse_new_loader import load_mouse_new
 
 def comprehensive_test():
     """综合测试所有功能"""
@@ -21,7 +16,7 @@ def comprehensive_test():
     # 1. 测试mouse_new导入
     print("📦 测试1: mouse_new模块导入")
     try:
-        import mouse as mouse_new
+        mouse_new = load_mouse_new()
         print("✅ mouse_new模块导入成功")
     except Exception as e:
         print(f"❌ mouse_new模块导入失败: {e}")
@@ -104,7 +99,7 @@ def comprehensive_test():
     target_screen_y = detection_window_top + enemy_head_detection_y
     
     # 计算移动距离
-    move_distance = math.sqrt((target_screen_x - current_x)**2 + (target_screen_y - current_y)**2)
+    move_distance = math.hypot(target_screen_x - current_x, target_screen_y - current_y)
     
     print(f"   模拟敌人头部检测坐标: ({enemy_head_detection_x}, {enemy_head_detection_y})")
     print(f"   转换后屏幕坐标: ({target_screen_x}, {target_screen_y})")
@@ -7,6 +7,7 @@
 import time
 import sys
 import os
+import statistics
 
 # 添加项目路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -138,7 +139,7 @@ def performance_test(mouse):
         
         # 测试移动性能
         test_count = 5
-        total_time = 0
+        move_times_ns = []
         success_count = 0
         
         center_x = mouse.screen_width // 2
@@ -153,12 +154,12 @@ def performance_test(mouse):
             target_x = center_x + offset_x
             target_y = center_y + offset_y
             
-            start_time = time.perf_counter()
+            # 整数纳秒计时，避免浮点累加误差
+            start_ns = time.perf_counter_ns()
             success = mouse.move_to_target(target_x, target_y, 0, False)
-            end_time = time.perf_counter()
+            move_times_ns.append(time.perf_counter_ns() - start_ns)
             
-            move_time = (end_time - start_time) * 1000
-            total_time += move_time
+            move_time = move_times_ns[-1] / 1e6
             
             if success:
                 success_count += 1
@@ -169,12 +170,16 @@ def performance_test(mouse):
             time.sleep(0.2)  # 短暂间隔
         
         # 计算统计结果
-        avg_time = total_time / test_count
+        avg_time = statistics.fmean(move_times_ns) / 1e6
+        median_time = statistics.median(move_times_ns) / 1e6
+        max_time = max(move_times_ns) / 1e6
         success_rate = (success_count / test_count) * 100
         
         print(f"\n📊 性能测试结果:")
         print(f"   成功率: {success_rate:.1f}% ({success_count}/{test_count})")
         print(f"   平均响应时间: {avg_time:.2f}ms")
+        print(f"   中位响应时间: {median_time:.2f}ms")
+        print(f"   最长响应时间: {max_time:.2f}ms")
         
         if avg_time <= 10 and success_rate >= 80:
             print("🎉 性能测试通过")
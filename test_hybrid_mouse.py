@@ -58,9 +58,14 @@ def test_relative_movement():
         print(f"\n🔄 执行相对移动: ({relative_x}, {relative_y})")
         win32api.mouse_event(win32con.MOUSEEVENTF_MOVE, relative_x, relative_y, 0, 0)
         
-        # 检查移动后的位置
-        time.sleep(0.1)
-        user32.GetCursorPos(ctypes.byref(point))
+        # mouse_event 异步生效：复用同一个 POINT 每 5ms 调一次 GetCursorPos，光标离开起点即停，20 次（约100ms）为上限
+        get_cursor_pos = user32.GetCursorPos
+        point_ref = ctypes.byref(point)
+        for _ in range(20):
+            get_cursor_pos(point_ref)
+            if (point.x, point.y) != (start_x, start_y):
+                break
+            time.sleep(0.005)
         end_x, end_y = point.x, point.y
         
         print(f"✅ 移动后位置: ({end_x}, {end_y})")
@@ -6,6 +6,7 @@
 
 import sys
 import os
+from mouse_new_loader import project_path, mouse_new_path, mouse_init_path, load_mouse_new
 
 def test_mouse_import():
     """测试鼠标模块导入"""
@@ -16,24 +17,13 @@ def test_mouse_import():
     # 方法1：测试安全导入
     print("📦 方法1: 使用importlib安全导入")
     try:
-        import importlib.util
-        
-        # 构建路径
-        mouse_new_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mouse_new')
-        mouse_init_path = os.path.join(mouse_new_path, "mouse", "__init__.py")
-        
         print(f"   mouse_new路径: {mouse_new_path}")
         print(f"   __init__.py路径: {mouse_init_path}")
         print(f"   路径存在: {os.path.exists(mouse_init_path)}")
         
         if os.path.exists(mouse_init_path):
             # 使用importlib导入
-            mouse_spec = importlib.util.spec_from_file_location(
-                "mouse_new_module", 
-                mouse_init_path
-            )
-            mouse_new = importlib.util.module_from_spec(mouse_spec)
-            mouse_spec.loader.exec_module(mouse_new)
+            mouse_new = load_mouse_new()
             
             # 检查函数
             has_get_position = hasattr(mouse_new, 'get_position')
@@ -69,12 +59,12 @@ def test_mouse_import():
     print("\n📦 方法2: 传统导入方式")
     try:
         # 添加路径
-        mouse_new_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mouse_new')
         if mouse_new_path not in sys.path:
             sys.path.insert(0, mouse_new_path)
         
-        # 清除缓存
-        if 'mouse' in sys.modules:
+        # 只有缓存的mouse不是mouse_new（例如项目根目录的mouse包）时才清除
+        cached_mouse = sys.modules.get('mouse')
+        if cached_mouse is not None and not (getattr(cached_mouse, '__file__', None) or '').startswith(mouse_new_path):
             del sys.modules['mouse']
         
         import mouse as mouse_new
@@ -147,8 +137,9 @@ def test_mouse_pure_module():
     print("-"*60)
     
     try:
-        # 添加项目路径
-        sys.path.append('.')
+        # logic 包位于项目根目录；本模块被其它程序导入时 sys.path 里不一定有该目录
+        if project_path not in sys.path:
+            sys.path.append(project_path)
         
         from logic.mouse_pure import mouse
         
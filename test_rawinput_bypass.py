@@ -47,9 +47,12 @@ def test_relative_move():
             # 执行相对移动
             success = mouse.mouse_event_relative_move(delta_x, delta_y)
             
-            # 验证结果
-            time.sleep(0.1)
-            after_x, after_y = mouse.get_current_mouse_position()
+            # 验证结果：坐标与移动前不同即视为已生效；未移动（例如被拦截）时最多重试 20 次，总计约100ms
+            for _ in range(20):
+                after_x, after_y = mouse.get_current_mouse_position()
+                if (after_x, after_y) != (before_x, before_y):
+                    break
+                time.sleep(0.005)
             
             actual_delta_x = after_x - before_x
             actual_delta_y = after_y - before_y
@@ -59,7 +62,7 @@ def test_relative_move():
             else:
                 print(f"   ❌ 失败")
             
-            time.sleep(0.5)
+            time.sleep(0.5)  # 留时间观察游戏内准心
         
         # 测试move_to_target接口
         print(f"\n🔧 测试move_to_target接口...")
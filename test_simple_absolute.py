@@ -4,19 +4,14 @@
 测试基本的坐标转换逻辑和mouse_new模块功能
 """
 
-import sys
-import os
 import math
-
-# 添加mouse_new路径
-mouse_new_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mouse_new')
-sys.path.insert(0, mouse_new_path)
+from mouse_new_loader import load_mouse_new
 
 def test_mouse_new_import():
     """测试mouse_new模块导入"""
     print("🧪 测试mouse_new模块导入...")
     try:
-        import mouse as mouse_new
+        mouse_new = load_mouse_new()
         print("✅ mouse_new模块导入成功")
         return mouse_new
     except Exception as e:
@@ -5,11 +5,14 @@
 """
 
 import sys
+import os
 import time
 import math
 
-# 添加项目路径
-sys.path.append('.')
+# 添加项目路径（按脚本位置，而不是当前工作目录）
+project_path = os.path.dirname(os.path.abspath(__file__))
+if project_path not in sys.path:
+    sys.path.append(project_path)
 
 def test_simple_absolute_mouse():
     """测试简化版绝对移动鼠标控制器"""
@@ -41,7 +44,7 @@ def test_simple_absolute_mouse():
     print(f"🔧 坐标转换测试: 检测({test_detection_x}, {test_detection_y}) -> 屏幕({screen_x}, {screen_y})")
     
     # 计算移动距离
-    move_distance = math.sqrt((screen_x - current_x)**2 + (screen_y - current_y)**2)
+    move_distance = math.hypot(screen_x - current_x, screen_y - current_y)
     print(f"📏 预计移动距离: {move_distance:.1f}px")
     
     print()
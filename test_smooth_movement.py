@@ -4,13 +4,46 @@
 验证mouse_new的duration参数是否能解决"一卡一卡"的问题
 """
 
-import sys
 import time
-import os
+import argparse
+from mouse_new_loader import load_mouse_new
 
-# 添加mouse_new路径
-mouse_new_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mouse_new')
-sys.path.insert(0, mouse_new_path)
+# 原理说明文本，一次输出
+SMOOTH_MOVEMENT_EXPLANATION = """\
+============================================================
+🧠 丝滑移动原理解释
+============================================================
+
+📋 问题分析:
+   - 之前的移动：每次AI检测都触发一次瞬间移动
+   - 结果：鼠标'一卡一卡'地移动到目标
+   - 原因：没有使用移动动画，每次都是瞬移
+
+🔧 丝滑移动解决方案:
+   - 使用mouse_new.move()的duration参数
+   - duration>0时，鼠标会平滑移动到目标
+   - steps_per_second控制移动帧率
+
+⚙️ 关键参数:
+   - duration: 移动持续时间
+     * 0.06s = 头部目标（快速精准）
+     * 0.08s = 身体目标（平衡）
+     * 0.10s+ = 远距离移动（超丝滑）
+
+   - steps_per_second: 移动帧率
+     * 120 FPS = 标准流畅
+     * 240 FPS = 高流畅度
+     * 300+ FPS = 极致流畅
+
+🎯 效果对比:
+   - 旧方式：目标(100,200) -> 瞬移 -> 到达
+   - 新方式：目标(100,200) -> 80ms平滑移动 -> 到达
+
+✅ 优势:
+   - 移动看起来自然丝滑
+   - 兼容Raw Input游戏
+   - 可调节移动速度
+   - 减少移动抖动"""
 
 def test_smooth_movement():
     """测试丝滑移动效果"""
@@ -19,7 +52,7 @@ def test_smooth_movement():
     print("="*60)
     
     try:
-        import mouse as mouse_new
+        mouse_new = load_mouse_new()
         print("✅ mouse_new模块导入成功")
     except Exception as e:
         print(f"❌ mouse_new模块导入失败: {e}")
@@ -84,7 +117,8 @@ def test_smooth_movement():
         
         try:
             # 执行移动
-            start_time = time.time()
+            # 高精度计时：Windows上time.time()分辨率约16ms，不足以衡量几十毫秒的移动
+            start_ns = time.perf_counter_ns()
             mouse_new.move(
                 target_x, 
                 target_y, 
@@ -92,10 +126,8 @@ def test_smooth_movement():
                 duration=test['duration'],
                 steps_per_second=240.0
             )
-            end_time = time.time()
-            
-            actual_duration = end_time - start_time
-            print(f"   ✅ 移动完成，实际耗时: {actual_duration*1000:.0f}ms")
+            actual_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            print(f"   ✅ 移动完成，实际耗时: {actual_ms:.2f}ms")
             
             # 验证位置
             final_x, final_y = mouse_new.get_position()
@@ -132,7 +164,7 @@ def test_gaming_scenario():
     print("="*60)
     
     try:
-        import mouse as mouse_new
+        mouse_new = load_mouse_new()
     except Exception as e:
         print(f"❌ mouse_new模块不可用: {e}")
         return False
@@ -195,43 +227,25 @@ def test_gaming_scenario():
 
 def explain_smooth_movement():
     """解释丝滑移动原理"""
-    print("="*60)
-    print("🧠 丝滑移动原理解释")
-    print("="*60)
-    print()
-    print("📋 问题分析:")
-    print("   - 之前的移动：每次AI检测都触发一次瞬间移动")
-    print("   - 结果：鼠标'一卡一卡'地移动到目标")
-    print("   - 原因：没有使用移动动画，每次都是瞬移")
-    print()
-    print("🔧 丝滑移动解决方案:")
-    print("   - 使用mouse_new.move()的duration参数")
-    print("   - duration>0时，鼠标会平滑移动到目标")
-    print("   - steps_per_second控制移动帧率")
-    print()
-    print("⚙️ 关键参数:")
-    print("   - duration: 移动持续时间")
-    print("     * 0.06s = 头部目标（快速精准）")
-    print("     * 0.08s = 身体目标（平衡）")
-    print("     * 0.10s+ = 远距离移动（超丝滑）")
-    print()
-    print("   - steps_per_second: 移动帧率")
-    print("     * 120 FPS = 标准流畅")
-    print("     * 240 FPS = 高流畅度")
-    print("     * 300+ FPS = 极致流畅")
-    print()
-    print("🎯 效果对比:")
-    print("   - 旧方式：目标(100,200) -> 瞬移 -> 到达")
-    print("   - 新方式：目标(100,200) -> 80ms平滑移动 -> 到达")
-    print()
-    print("✅ 优势:")
-    print("   - 移动看起来自然丝滑")
-    print("   - 兼容Raw Input游戏")
-    print("   - 可调节移动速度")
-    print("   - 减少移动抖动")
+    print(SMOOTH_MOVEMENT_EXPLANATION)
+
+# 命令行子命令 -> 测试函数，便于脚本直接调用单项测试
+COMMANDS = {
+    'explain': explain_smooth_movement,
+    'smooth': test_smooth_movement,
+    'gaming': test_gaming_scenario,
+}
 
 def main():
-    """主测试函数"""
+    """主测试函数：带子命令时直接执行对应测试，否则进入交互菜单"""
+    parser = argparse.ArgumentParser(description="丝滑移动测试工具")
+    parser.add_argument('cmd', nargs='?', choices=COMMANDS,
+                        help="explain=原理说明, smooth=不同移动方式, gaming=游戏瞄准场景；省略则进入菜单")
+    args = parser.parse_args()
+    if args.cmd:
+        COMMANDS[args.cmd]()
+        return
+    
     print("="*60)
     print("🎯 丝滑移动测试工具")
     print("="*60)
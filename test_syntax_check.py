@@ -11,11 +11,12 @@ import os
 def check_syntax(file_path):
     """检查Python文件语法"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        # 以字节读取，交给解析器按源码编码声明解码，省去一次str转换
+        with open(file_path, 'rb') as f:
             content = f.read()
         
-        # 尝试解析AST
-        ast.parse(content)
+        # 尝试解析AST（带文件名，语法错误信息会指向具体文件）
+        ast.parse(content, filename=file_path)
         print(f"✅ {file_path}: 语法正确")
         return True
     except SyntaxError as e:
@@ -6,6 +6,7 @@
 
 import ctypes
 from ctypes import wintypes
+import math
 import time
 
 def test_windows_api_move():
@@ -15,8 +16,8 @@ def test_windows_api_move():
     print("="*60)
     
     try:
-        # 设置Windows API
-        user32 = ctypes.windll.user32
+        # 设置Windows API（独立句柄，失败时可读取GetLastError）
+        user32 = ctypes.WinDLL('user32', use_last_error=True)
         
         # 设置函数签名
         user32.GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
@@ -33,7 +34,8 @@ def test_windows_api_move():
             start_x, start_y = point.x, point.y
             print(f"🖱️ 当前鼠标位置: ({start_x}, {start_y})")
         else:
-            print("❌ 获取鼠标位置失败")
+            err = ctypes.get_last_error()
+            print(f"❌ 获取鼠标位置失败: [{err}] {ctypes.FormatError(err)}")
             return False
         
         # 模拟绝对移动场景
@@ -62,7 +64,7 @@ def test_windows_api_move():
         print(f"🎯 转换后屏幕坐标: ({target_screen_x}, {target_screen_y})")
         
         # 计算移动距离
-        move_distance = ((target_screen_x - start_x)**2 + (target_screen_y - start_y)**2)**0.5
+        move_distance = math.hypot(target_screen_x - start_x, target_screen_y - start_y)
         print(f"📏 移动距离: {move_distance:.1f}px")
         
         print()